@@ -0,0 +1,63 @@
+"""Beginner Python projects packaged as importable modules.
+
+Submodules are imported lazily on first attribute access, so
+``from python_projects import convert_temperature`` only loads the
+temperature converter and never starts any interactive program.
+"""
+
+import importlib
+
+_SUBMODULES = (
+    'calculator',
+    'temperature_converter',
+    'rock_paper_scissors',
+    'transcript_generator',
+    'exam_system'
+)
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'add': 'calculator',
+    'subtract': 'calculator',
+    'multiply': 'calculator',
+    'divide': 'calculator',
+    'TEMPERATURE_SCALES': 'temperature_converter',
+    'convert_temperature': 'temperature_converter',
+    'register_scale': 'temperature_converter',
+    'play_round': 'rock_paper_scissors',
+    'simulate': 'rock_paper_scissors',
+    'simulate_match': 'rock_paper_scissors',
+    'run_tournament': 'rock_paper_scissors',
+    'make_strategy': 'rock_paper_scissors',
+    'STRATEGIES': 'rock_paper_scissors',
+    'Strategy': 'rock_paper_scissors',
+    'MarkovStrategy': 'rock_paper_scissors',
+    'FrequencyStrategy': 'rock_paper_scissors',
+    'read_student_data': 'transcript_generator',
+    'write_student_data': 'transcript_generator',
+    'calculate_gpa': 'transcript_generator',
+    'generate_transcript': 'transcript_generator',
+    'User': 'exam_system',
+    'Admin': 'exam_system',
+    'Student': 'exam_system',
+    'QuestionIndex': 'exam_system',
+    'save_data': 'exam_system',
+    'load_data': 'exam_system',
+    'collect_all_exams': 'exam_system'
+}
+
+__all__ = list(_SUBMODULES) + list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+        globals()[name] = value  # cache so later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,11 +1,151 @@
+import heapq
+import math
 import os
+import re
 from abc import ABC, abstractmethod
 
-print("""
+BANNER = """
 ----------------------------------------------------------------------
                       :: Online Exam System ::
 ----------------------------------------------------------------------
-""")
+"""
+
+# Inverted index over question text and options
+class QuestionIndex:
+    _TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+    def __init__(self):
+        self._postings = {}  # token -> set of document ids
+        self._docs = {}  # document id -> (exam name, question position, token set)
+        self._keys = {}  # (exam name, question position) -> document id
+        self._exam_docs = {}  # exam name -> set of document ids
+        self._next_id = 0
+
+    @classmethod
+    def tokenize(cls, text):
+        """Split text into lowercase alphanumeric tokens."""
+        return cls._TOKEN_PATTERN.findall(text.lower())
+
+    def _question_tokens(self, question, options):
+        tokens = set(self.tokenize(question))
+        for option in options:
+            tokens.update(self.tokenize(option))
+        return frozenset(tokens)
+
+    def __len__(self):
+        return len(self._docs)
+
+    def add(self, exam_name, position, question, options):
+        """Index the question at a 0-based position of an exam, replacing any previous entry."""
+        self.remove(exam_name, position)
+        doc_id = self._next_id
+        self._next_id += 1
+
+        tokens = self._question_tokens(question, options)
+        self._docs[doc_id] = (exam_name, position, tokens)
+        self._keys[(exam_name, position)] = doc_id
+        self._exam_docs.setdefault(exam_name, set()).add(doc_id)
+        for token in tokens:
+            self._postings.setdefault(token, set()).add(doc_id)
+
+    def remove(self, exam_name, position):
+        """Remove the question at a 0-based position of an exam from the index."""
+        doc_id = self._keys.pop((exam_name, position), None)
+        if doc_id is None:
+            return
+
+        _, _, tokens = self._docs.pop(doc_id)
+        self._exam_docs[exam_name].discard(doc_id)
+        if not self._exam_docs[exam_name]:
+            del self._exam_docs[exam_name]
+        for token in tokens:
+            postings = self._postings[token]
+            postings.discard(doc_id)
+            if not postings:
+                del self._postings[token]
+
+    def remove_exam(self, exam_name):
+        """Remove every question of an exam from the index."""
+        for doc_id in list(self._exam_docs.get(exam_name, ())):
+            _, position, _ = self._docs[doc_id]
+            self.remove(exam_name, position)
+
+    def clear(self):
+        """Remove every question from the index."""
+        self._postings.clear()
+        self._docs.clear()
+        self._keys.clear()
+        self._exam_docs.clear()
+        self._next_id = 0
+
+    def rebuild(self, exams):
+        """Re-index all questions of an exams dictionary from scratch."""
+        self.clear()
+        for exam_name, data in exams.items():
+            for position, question in enumerate(data["questions"]):
+                self.add(exam_name, position, question["question"], question["options"])
+
+    def _matching_ids(self, query):
+        tokens = set(self.tokenize(query))
+        if not tokens:
+            return set()
+
+        # Intersect the shortest posting lists first
+        postings = sorted((self._postings.get(token, set()) for token in tokens), key=len)
+        matches = postings[0]
+        for posting in postings[1:]:
+            if not matches:
+                break
+            matches = matches & posting
+        return matches
+
+    def search(self, query, limit=None):
+        """Return (exam name, 0-based position) of questions containing every query token,
+        in the order they were indexed."""
+        return self.search_page(query, limit)[1]
+
+    def search_page(self, query, limit=None):
+        """Return the number of questions containing every query token and the first limit
+        of them, in the order they were indexed, without ordering the rest."""
+        matches = self._matching_ids(query)
+        if limit is None:
+            doc_ids = sorted(matches)
+        elif len(matches) ** 2 > limit * len(self._docs):
+            # Broad query: walking the documents in id order reaches limit matches sooner
+            doc_ids = []
+            for doc_id in self._docs:
+                if len(doc_ids) >= limit:
+                    break
+                if doc_id in matches:
+                    doc_ids.append(doc_id)
+        else:
+            doc_ids = heapq.nsmallest(limit, matches)
+        return len(matches), [self._docs[doc_id][:2] for doc_id in doc_ids]
+
+    def find_similar(self, question, options, threshold=0.8):
+        """Return (exam name, 0-based position, similarity) of questions whose token sets have
+        a Jaccard similarity of at least threshold with the given question, most similar first."""
+        tokens = self._question_tokens(question, options)
+        if not tokens:
+            return []
+
+        # A match must share at least ceil(threshold * |tokens|) tokens, so it contains one of
+        # the rarest |tokens| - overlap + 1 tokens; only their postings need to be scanned.
+        overlap = max(1, math.ceil(threshold * len(tokens) - 1e-9))
+        rarest = sorted(tokens, key=lambda token: len(self._postings.get(token, ())))
+        candidates = set()
+        for token in rarest[:len(tokens) - overlap + 1]:
+            candidates.update(self._postings.get(token, ()))
+
+        similar = []
+        for doc_id in candidates:
+            exam_name, position, doc_tokens = self._docs[doc_id]
+            similarity = len(tokens & doc_tokens) / len(tokens | doc_tokens)
+            if similarity >= threshold:
+                similar.append((exam_name, position, similarity))
+        similar.sort(key=lambda match: (-match[2], match[0], match[1]))
+        return similar
+
 
 # Abstract class for shared user behavior
 class User(ABC):
@@ -27,6 +167,7 @@ class Admin(User):
         super().__init__(username, password)
         self.exams = {}  # Dictionary to store exam data
         self.student_results = {}  # Dictionary to store student results
+        self.question_index = QuestionIndex()  # Inverted index over all exam questions
 
     def add_exam(self, exam_name, department_name):
         """Add a new exam to the system."""
@@ -40,6 +181,7 @@ class Admin(User):
         """Delete an existing exam from the system."""
         if exam_name in self.exams:
             del self.exams[exam_name]
+            self.question_index.remove_exam(exam_name)
             print(f"Exam '{exam_name}' deleted successfully.")
         else:
             print("Exam does not exist.")
@@ -54,11 +196,17 @@ class Admin(User):
             print("Correct option must be one of the provided options.")
             return
 
-        self.exams[exam_name]["questions"].append({
+        for similar_exam, position, similarity in self.question_index.find_similar(question, options):
+            print(f"Warning: similar to question {position + 1} in exam '{similar_exam}' "
+                  f"({similarity:.0%} similar).")
+
+        questions = self.exams[exam_name]["questions"]
+        questions.append({
             "question": question,
             "options": options,
             "correct": correct_option
         })
+        self.question_index.add(exam_name, len(questions) - 1, question, options)
         print("Question added successfully.")
 
     def view_questions(self, exam_name):
@@ -99,8 +247,28 @@ class Admin(User):
             "options": new_options,
             "correct": new_correct_option
         }
+        self.question_index.add(exam_name, question_index - 1, new_question, new_options)
         print("Question updated successfully.")
 
+    def search_questions(self, query, limit=20):
+        """Search questions across all exams for text containing every word of the query."""
+        total, matches = self.question_index.search_page(query, limit)
+        if not matches:
+            print("No matching questions found.")
+            return []
+
+        print(f"Found {total} matching question(s):")
+        for exam_name, position in matches:
+            question = self.exams[exam_name]["questions"][position]
+            print(f"  [{exam_name}] {position + 1}. {question['question']}")
+        if total > len(matches):
+            print(f"  ... and {total - len(matches)} more.")
+        return matches
+
+    def rebuild_question_index(self):
+        """Re-index all questions, e.g. after replacing the exams dictionary."""
+        self.question_index.rebuild(self.exams)
+
     def display_info(self):
         """Display admin information."""
         print(f"Admin: {self._username}")  # Polymorphism: Different display for Admin
@@ -233,6 +401,7 @@ def collect_all_exams(admins):
 
 
 def main():
+    print(BANNER)
     admin_data_file = "admin_data.txt"
     student_data_file = "student_data.txt"
     exams_data_file = "exams_data.txt"
@@ -272,7 +441,8 @@ def main():
                     print("5. View Questions in Exam")
                     print("6. Edit Question in Exam")
                     print("7. View All Student Results")
-                    print("8. Logout")
+                    print("8. Search Questions")
+                    print("9. Logout")
 
                     admin_choice = input("Enter your choice: ").strip()
 
@@ -333,6 +503,12 @@ def main():
                     elif admin_choice == "7":
                         admin.view_all_student_results()
                     elif admin_choice == "8":
+                        query = input("Enter search words: ").strip()
+                        if query:
+                            admin.search_questions(query)
+                        else:
+                            print("Search words cannot be empty.")
+                    elif admin_choice == "9":
                         save_data(exams_data_file, {k: v.exams for k, v in admins.items()})
                         print("Logged out.")
                         break
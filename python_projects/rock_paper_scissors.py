@@ -0,0 +1,429 @@
+import math
+import random
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from itertools import combinations
+
+CHOICE_NAMES = {1: 'Rock', 2: 'Paper', 3: 'Scissors'}
+
+# OUTCOME_TABLE[user - 1][computer - 1] is 1 if the user wins, -1 if the computer wins and 0 for a draw
+OUTCOME_TABLE = [[((user - computer) % 3 + 1) % 3 - 1 for computer in range(3)] for user in range(3)]
+
+# COUNTER_MOVE[move] is the move that beats move
+COUNTER_MOVE = {1: 2, 2: 3, 3: 1}
+
+RESULT_MESSAGES = {
+    1: "<== User wins! ==>",
+    0: "<== It's a tie! ==>",
+    -1: "<== Computer wins! ==>"
+}
+
+
+def play_round(choice, comp_choice):
+    """Returns 1 if choice beats comp_choice, -1 if it loses and 0 for a draw."""
+    return OUTCOME_TABLE[choice - 1][comp_choice - 1]
+
+
+class Strategy(ABC):
+    """Base class for a player: choose() returns a move (1-3), observe() sees the other side's move."""
+
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else random.Random()
+
+    @abstractmethod
+    def choose(self):
+        pass
+
+    def observe(self, opponent_move):
+        pass
+
+
+class RandomStrategy(Strategy):
+    """Plays uniformly at random."""
+
+    def choose(self):
+        return self.rng.randint(1, 3)
+
+
+class RockStrategy(Strategy):
+    """Always plays Rock."""
+
+    def choose(self):
+        return 1
+
+
+class CycleStrategy(Strategy):
+    """Plays Rock, Paper, Scissors in turn."""
+
+    def __init__(self, rng=None):
+        super().__init__(rng)
+        self.move = self.rng.randint(1, 3)
+
+    def choose(self):
+        self.move = self.move % 3 + 1
+        return self.move
+
+
+class MarkovStrategy(Strategy):
+    """Predicts the opponent's next move from their last `order` moves and plays the counter.
+
+    Counts are kept per context (at most 3 ** order rows of 3 counts) and the updated row is
+    multiplied by `decay` each round, so old history fades and every update is O(1).
+    With order=0 this is a plain frequency predictor.
+    """
+
+    def __init__(self, rng=None, order=1, decay=0.98):
+        super().__init__(rng)
+        if order < 0:
+            raise ValueError("Order must not be negative.")
+        if not 0 < decay <= 1:
+            raise ValueError("Decay must be in (0, 1].")
+        self.order = order
+        self.decay = decay
+        self.history = deque(maxlen=order)
+        self.counts = {}
+
+    def choose(self):
+        row = self.counts.get(tuple(self.history)) if len(self.history) == self.order else None
+        if row is None:
+            return self.rng.randint(1, 3)
+        best = max(row)
+        predicted = self.rng.choice([move for move in (1, 2, 3) if row[move - 1] == best])
+        return COUNTER_MOVE[predicted]
+
+    def observe(self, opponent_move):
+        if len(self.history) == self.order:
+            context = tuple(self.history)
+            row = self.counts.get(context)
+            if row is None:
+                row = self.counts[context] = [0.0, 0.0, 0.0]
+            for i in range(3):
+                row[i] *= self.decay
+            row[opponent_move - 1] += 1
+        if self.order:
+            self.history.append(opponent_move)
+
+
+class FrequencyStrategy(MarkovStrategy):
+    """Counters the opponent's most frequent (recently weighted) move."""
+
+    def __init__(self, rng=None, decay=0.98):
+        super().__init__(rng, order=0, decay=decay)
+
+
+STRATEGIES = {
+    'random': RandomStrategy,
+    'rock': RockStrategy,
+    'cycle': CycleStrategy,
+    'frequency': FrequencyStrategy,
+    'markov': MarkovStrategy
+}
+
+
+def make_strategy(name, rng=None, **options):
+    """Creates a registered strategy by name."""
+    if name not in STRATEGIES:
+        raise ValueError(f"Unknown strategy '{name}'. Choose from: {', '.join(STRATEGIES)}")
+    return STRATEGIES[name](rng, **options)
+
+
+def simulate_match(player, computer, rounds):
+    """Plays rounds between two strategies and returns the win/draw/loss counts of player."""
+    if rounds < 0:
+        raise ValueError("Number of rounds must not be negative.")
+
+    counts = {1: 0, 0: 0, -1: 0}
+    for _ in range(rounds):
+        choice = player.choose()
+        comp_choice = computer.choose()
+        counts[OUTCOME_TABLE[choice - 1][comp_choice - 1]] += 1
+        player.observe(comp_choice)
+        computer.observe(choice)
+    return {'wins': counts[1], 'draws': counts[0], 'losses': counts[-1]}
+
+
+def play_chunk(task):
+    """Plays one chunk of a tournament match; takes a picklable tuple so it can run in a worker process."""
+    match, name_a, name_b, rounds, seed_a, seed_b, options = task
+    player = make_strategy(name_a, random.Random(seed_a), **options.get(name_a, {}))
+    computer = make_strategy(name_b, random.Random(seed_b), **options.get(name_b, {}))
+    return match, simulate_match(player, computer, rounds)
+
+
+def points_share(counts):
+    """Returns the share of points won per round, counting a win as 1 and a draw as 1/2."""
+    rounds = counts['wins'] + counts['draws'] + counts['losses']
+    if rounds == 0:
+        return 0.0
+    return (counts['wins'] + counts['draws'] / 2) / rounds
+
+
+def wilson_interval(counts, z=1.96):
+    """Returns the Wilson score interval of points_share(counts).
+
+    A per-round score in [0, 1] with mean p has variance at most p * (1 - p), so the
+    Wilson interval is conservative for it and always stays within [0, 1].
+    """
+    rounds = counts['wins'] + counts['draws'] + counts['losses']
+    if rounds == 0:
+        return 0.0, 1.0
+    share = points_share(counts)
+    denominator = 1 + z ** 2 / rounds
+    centre = (share + z ** 2 / (2 * rounds)) / denominator
+    margin = z * math.sqrt(share * (1 - share) / rounds + z ** 2 / (4 * rounds ** 2)) / denominator
+    return max(centre - margin, 0.0), min(centre + margin, 1.0)
+
+
+def run_tournament(names, rounds, seed=None, workers=None, options=None, chunk_rounds=10_000):
+    """Plays every pairing of the named strategies across a process pool.
+
+    Each match is split into chunks of at most chunk_rounds rounds, played by fresh strategies
+    with their own seeds, so the work spreads over all workers even with few pairings. The
+    seeds only depend on seed and chunk_rounds, so results do not depend on scheduling.
+    Returns the per-match results and the aggregated win/draw/loss totals of each strategy.
+    """
+    names = list(dict.fromkeys(names))
+    for name in names:
+        if name not in STRATEGIES:
+            raise ValueError(f"Unknown strategy '{name}'. Choose from: {', '.join(STRATEGIES)}")
+    if len(names) < 2:
+        raise ValueError("A tournament needs at least two strategies.")
+    if rounds < 0:
+        raise ValueError("Number of rounds must not be negative.")
+    if chunk_rounds < 1:
+        raise ValueError("Rounds per chunk must be at least 1.")
+
+    master = random.Random(seed)
+    pairings = list(combinations(names, 2))
+    tasks = []
+    for match, (name_a, name_b) in enumerate(pairings):
+        for start in range(0, rounds, chunk_rounds):
+            tasks.append((match, name_a, name_b, min(chunk_rounds, rounds - start),
+                          master.getrandbits(64), master.getrandbits(64), options or {}))
+
+    if workers == 1:
+        results = [play_chunk(task) for task in tasks]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(play_chunk, tasks))
+
+    totals = [{'wins': 0, 'draws': 0, 'losses': 0} for _ in pairings]
+    for match, counts in results:
+        for key in counts:
+            totals[match][key] += counts[key]
+    matches = [(name_a, name_b, counts) for (name_a, name_b), counts in zip(pairings, totals)]
+
+    standings = {name: {'wins': 0, 'draws': 0, 'losses': 0} for name in names}
+    for name_a, name_b, counts in matches:
+        for key in counts:
+            standings[name_a][key] += counts[key]
+        standings[name_b]['wins'] += counts['losses']
+        standings[name_b]['draws'] += counts['draws']
+        standings[name_b]['losses'] += counts['wins']
+    return matches, standings
+
+
+def draw_moves(rng, size, probs=None):
+    """Draws size moves (0 = Rock, 1 = Paper, 2 = Scissors) from a NumPy generator."""
+    if probs is None:
+        return rng.integers(3, size=size)
+    return rng.choice(3, size=size, p=probs)
+
+
+def simulate(rounds, player_probs=None, computer_probs=None, seed=None, chunk_size=1_000_000):
+    """Plays rounds headlessly with NumPy and returns the win/draw/loss counts of the player.
+
+    player_probs and computer_probs are (rock, paper, scissors) probabilities and default to
+    uniform. The player and the computer draw from independent streams spawned from seed.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise RuntimeError("The simulation engine requires NumPy (pip install numpy).") from None
+
+    if rounds < 0:
+        raise ValueError("Number of rounds must not be negative.")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1.")
+
+    outcomes = np.array(OUTCOME_TABLE, dtype=np.int8) + 1  # shift to 0..2 for bincount
+    player_rng, computer_rng = (np.random.default_rng(stream)
+                                for stream in np.random.SeedSequence(seed).spawn(2))
+
+    counts = np.zeros(3, dtype=np.int64)
+    remaining = rounds
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        player = draw_moves(player_rng, size, player_probs)
+        computer = draw_moves(computer_rng, size, computer_probs)
+        counts += np.bincount(outcomes[player, computer], minlength=3)
+        remaining -= size
+
+    losses, draws, wins = (int(count) for count in counts)
+    return {'wins': wins, 'draws': draws, 'losses': losses}
+
+
+def parse_probs(text):
+    """Parses 'rock,paper,scissors' weights into probabilities summing to one."""
+    if text is None:
+        return None
+    weights = [float(weight) for weight in text.split(',')]
+    if len(weights) != 3 or min(weights) < 0 or sum(weights) == 0:
+        import argparse
+
+        raise argparse.ArgumentTypeError("Expected three non-negative weights, e.g. 1,1,2")
+    total = sum(weights)
+    return [weight / total for weight in weights]
+
+
+def strategy_options(name, args):
+    """Returns the command line options that apply to the named strategy."""
+    return {'order': args.order} if name == 'markov' else {}
+
+
+def run_simulation(args):
+    """Runs the headless simulation and prints a summary."""
+    start = time.perf_counter()
+    if args.strategy is None and args.opponent is None:
+        counts = simulate(args.simulate, args.player, args.computer, args.seed)
+    else:
+        if args.player is not None or args.computer is not None:
+            raise ValueError("--player/--computer weights cannot be combined with strategies.")
+        # Independent, reproducible streams for both sides
+        master = random.Random(args.seed)
+        player_name = args.strategy or 'random'
+        computer_name = args.opponent or 'random'
+        player = make_strategy(player_name, random.Random(master.getrandbits(64)),
+                               **strategy_options(player_name, args))
+        computer = make_strategy(computer_name, random.Random(master.getrandbits(64)),
+                                 **strategy_options(computer_name, args))
+        counts = simulate_match(player, computer, args.simulate)
+    elapsed = time.perf_counter() - start
+
+    print(f"Simulated {args.simulate} rounds in {elapsed:.3f}s")
+    for key in ('wins', 'draws', 'losses'):
+        share = counts[key] / args.simulate if args.simulate else 0.0
+        print(f"  Player {key:<7}{counts[key]:>12} ({share:.4%})")
+
+
+def print_tournament(args):
+    """Runs a round-robin tournament and prints the match and standings tables."""
+    options = {'markov': {'order': args.order}}
+    start = time.perf_counter()
+    matches, standings = run_tournament(args.tournament, args.rounds, args.seed, args.workers, options,
+                                        args.chunk_rounds)
+    elapsed = time.perf_counter() - start
+
+    print(f"Played {len(matches)} matches of {args.rounds} rounds in {elapsed:.3f}s")
+    print("Points: win = 1, draw = 1/2, per round\n")
+    print(f"{'Player':<12}{'Opponent':<12}{'Wins':>10}{'Draws':>10}{'Losses':>10}{'Points (95% CI)':>30}")
+    print("=" * 84)
+    for name_a, name_b, counts in matches:
+        low, high = wilson_interval(counts)
+        print(f"{name_a:<12}{name_b:<12}{counts['wins']:>10}{counts['draws']:>10}{counts['losses']:>10}"
+              f"{f'{points_share(counts):.4f} [{low:.4f}, {high:.4f}]':>30}")
+
+    # Pooled over different opponents, so the standings are descriptive only (no interval)
+    ranked = sorted(standings.items(), key=lambda item: points_share(item[1]), reverse=True)
+    print("\nStandings:")
+    print(f"{'Rank':<6}{'Strategy':<18}{'Wins':>10}{'Draws':>10}{'Losses':>10}{'Points':>30}")
+    print("=" * 84)
+    for rank, (name, counts) in enumerate(ranked, start=1):
+        print(f"{rank:<6}{name:<18}{counts['wins']:>10}{counts['draws']:>10}{counts['losses']:>10}"
+              f"{points_share(counts):>30.4f}")
+
+
+def play_game(opponent=None):
+    """Plays interactive rounds against the computer until the user quits."""
+    if opponent is None:
+        opponent = RandomStrategy()
+
+    # Print multiline instruction
+    print('Winning rules of the game ROCK PAPER SCISSORS are:\n'
+          + "Rock vs Paper -> Paper wins \n"
+          + "Rock vs Scissors -> Rock wins \n"
+          + "Paper vs Scissors -> Scissors wins \n")
+
+    while True:
+
+        print("Enter your choice \n 1 - Rock \n 2 - Paper \n 3 - Scissors \n")
+
+        # Take the input from user
+        choice = int(input("Enter your choice: "))
+
+        # Looping until user enters valid input
+        while choice > 3 or choice < 1:
+            choice = int(input('Enter a valid choice please : '))
+
+        choice_name = CHOICE_NAMES[choice]
+
+        # Print user choice
+        print('User choice is:', choice_name)
+        print("Now it's Computer's Turn...")
+
+        # Computer chooses a number among 1, 2, and 3 using its strategy
+        comp_choice = opponent.choose()
+        opponent.observe(choice)
+        comp_choice_name = CHOICE_NAMES[comp_choice]
+
+        print("Computer choice is:", comp_choice_name)
+        print(choice_name, 'vs', comp_choice_name)
+
+        # Determine the winner and print the result
+        print(RESULT_MESSAGES[play_round(choice, comp_choice)])
+
+        # Ask if the user wants to play again
+        print("Do you want to play again? (Y/N)")
+        ans = input().lower()
+        if ans == 'n':
+            break
+
+    # After coming out of the while loop, print thanks for playing
+    print("Thanks for playing!")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Rock Paper Scissors")
+    parser.add_argument('--simulate', type=int, metavar='ROUNDS',
+                        help="play ROUNDS headless rounds instead of the interactive game")
+    parser.add_argument('--seed', type=int, help="seed for the simulation RNG streams")
+    parser.add_argument('--player', type=parse_probs, metavar='R,P,S',
+                        help="player move weights for the simulation (default uniform)")
+    parser.add_argument('--computer', type=parse_probs, metavar='R,P,S',
+                        help="computer move weights for the simulation (default uniform)")
+    parser.add_argument('--opponent', choices=STRATEGIES,
+                        help="computer strategy (default random)")
+    parser.add_argument('--strategy', choices=STRATEGIES,
+                        help="player strategy for the simulation (default random)")
+    parser.add_argument('--order', type=int, default=1,
+                        help="number of past moves the markov strategy looks at (default 1)")
+    parser.add_argument('--tournament', nargs='+', metavar='STRATEGY',
+                        help="play a round-robin tournament between the given strategies")
+    parser.add_argument('--rounds', type=int, default=100_000,
+                        help="rounds per tournament match (default 100000)")
+    parser.add_argument('--workers', type=int,
+                        help="tournament worker processes (default: one per core)")
+    parser.add_argument('--chunk-rounds', type=int, default=10_000,
+                        help="rounds per tournament task; matches are split into chunks of this size "
+                             "(default 10000)")
+    args = parser.parse_args()
+
+    try:
+        if args.tournament is not None:
+            print_tournament(args)
+        elif args.simulate is not None:
+            run_simulation(args)
+        else:
+            opponent_name = args.opponent or 'random'
+            play_game(make_strategy(opponent_name, **strategy_options(opponent_name, args)))
+    except (RuntimeError, ValueError) as error:
+        parser.exit(1, f"{error}\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+from fractions import Fraction
+
+# Name -> symbol of every registered scale
+TEMPERATURE_SCALES = {}
+
+# Every scale is an affine map to Kelvin: kelvin = value * scale + offset
+# (exact fractions, so the composed coefficients round only once)
+KELVIN_COEFFICIENTS = {}
+
+# Pairwise coefficients, composed once so a conversion is a single multiply-add
+CONVERSION_TABLE = {}
+
+
+def register_scale(name, symbol, scale, offset):
+    """Registers a new scale given its affine map to Kelvin and updates the conversion table.
+
+    Raises ValueError if the name or symbol is already registered.
+    """
+    scale, offset = Fraction(scale), Fraction(offset)
+    if scale == 0:
+        raise ValueError(f"Scale factor for '{symbol}' must be non-zero.")
+    if name in TEMPERATURE_SCALES:
+        raise ValueError(f"Temperature scale '{name}' is already registered.")
+    if symbol in KELVIN_COEFFICIENTS:
+        raise ValueError(f"Temperature scale symbol '{symbol}' is already registered.")
+
+    TEMPERATURE_SCALES[name] = symbol
+    KELVIN_COEFFICIENTS[symbol] = (scale, offset)
+
+    for other, (other_scale, other_offset) in KELVIN_COEFFICIENTS.items():
+        # symbol -> other: (value * scale + offset - other_offset) / other_scale
+        CONVERSION_TABLE[(symbol, other)] = (float(scale / other_scale),
+                                             float((offset - other_offset) / other_scale))
+        # other -> symbol: (value * other_scale + other_offset - offset) / scale
+        CONVERSION_TABLE[(other, symbol)] = (float(other_scale / scale),
+                                             float((other_offset - offset) / scale))
+    CONVERSION_TABLE[(symbol, symbol)] = (1.0, 0.0)
+
+
+def convert_temperature(value, input_scale, output_scale):
+    try:
+        scale, offset = CONVERSION_TABLE[(input_scale, output_scale)]
+    except KeyError:
+        unknown = input_scale if input_scale not in KELVIN_COEFFICIENTS else output_scale
+        raise ValueError(f"Unknown temperature scale: '{unknown}'") from None
+    return value * scale + offset
+
+
+def _register_default_scales():
+    register_scale('Celsius', 'C', 1, Fraction('273.15'))
+    register_scale('Fahrenheit', 'F', Fraction(5, 9), Fraction('459.67') * Fraction(5, 9))
+    register_scale('Kelvin', 'K', 1, 0)
+    register_scale('Rankine', 'R', Fraction(5, 9), 0)
+    register_scale('Reaumur', 'RE', Fraction(5, 4), Fraction('273.15'))
+    register_scale('Delisle', 'DE', Fraction(-2, 3), Fraction('373.15'))
+    register_scale('Newton', 'N', Fraction(100, 33), Fraction('273.15'))
+    register_scale('Romer', 'RO', Fraction(40, 21), Fraction('273.15') - Fraction('7.5') * Fraction(40, 21))
+
+
+_register_default_scales()
+
+
+def main():
+    while True:
+        # Prompt the user for input
+        print('Enter the input temperature value:')
+        value = float(input())
+        symbols = ', '.join(TEMPERATURE_SCALES.values())
+        print(f'Enter the input temperature scale ({symbols}):')
+        input_scale = input().upper()
+        print(f'Enter the output temperature scale ({symbols}):')
+        output_scale = input().upper()
+
+        # Convert the temperature and print the result
+        try:
+            result = convert_temperature(value, input_scale, output_scale)
+            print(f'{value} {input_scale} = {result} {output_scale}')
+        except ValueError as error:
+            print(error)
+
+        # Prompt the user to continue or quit
+        print('Enter q to quit, or any other key to continue:')
+        choice = input()
+        if choice.lower() == 'q':
+            break
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,6 @@
 import os
 
-
-print("""
+BANNER = """
 **************************************************
         Dhaka Internation University
 Department of Computer Science and Engineering
@@ -9,7 +8,9 @@ Department of Computer Science and Engineering
 
      :: Academic Transcript Generator ::
 
-""")
+"""
+
+
 def read_student_data(filename):
     """Reads student data from a file and returns a dictionary."""
     if not os.path.exists(filename):
@@ -161,6 +162,7 @@ def delete_result(student_data):
     print("Course not found.")
 
 def main():
+    print(BANNER)
     input_file = 'student_data.txt'
     output_file = 'transcript.txt'
 